@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from operator import attrgetter
+from time import monotonic
 
 from vivintpy.devices import BypassTamperDevice, VivintDevice
 from vivintpy.devices.camera import MOTION_DETECTED, Camera
@@ -22,13 +23,26 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_call_later
-from homeassistant.util.dt import utcnow
 
 from .const import DOMAIN
 from .hub import VivintBaseEntity, VivintEntity, VivintHub
 
 MOTION_STOPPED_SECONDS = 30
 
+_SENTINEL = object()
+
+EQUIPMENT_CLASS_MAP = {
+    EquipmentType.MOTION: BinarySensorDeviceClass.MOTION,
+    EquipmentType.FREEZE: BinarySensorDeviceClass.COLD,
+    EquipmentType.WATER: BinarySensorDeviceClass.MOISTURE,
+    EquipmentType.TEMPERATURE: BinarySensorDeviceClass.HEAT,
+}
+SENSOR_CLASS_MAP = {
+    SensorType.FIRE: BinarySensorDeviceClass.SMOKE,
+    SensorType.FIRE_WITH_VERIFICATION: BinarySensorDeviceClass.SMOKE,
+    SensorType.CARBON_MONOXIDE: BinarySensorDeviceClass.GAS,
+}
+
 ENTITY_DESCRIPTION_MOTION = BinarySensorEntityDescription(
     "motion", device_class=BinarySensorDeviceClass.MOTION
 )
@@ -54,17 +68,10 @@ async def async_setup_entry(
                     if isinstance(device, cls)
                     for description in descriptions
                 )
-                if isinstance(device, WirelessSensor):
-                    entities.append(VivintBinarySensorEntityOld(device=device, hub=hub))
-                elif isinstance(device, Camera):
-                    entities.append(
-                        VivintCameraBinarySensorEntity(
-                            device=device,
-                            hub=hub,
-                            entity_description=ENTITY_DESCRIPTION_MOTION,
-                        )
-                    )
-                if hasattr(device, "is_online"):
+                factory = DEVICE_ENTITY_FACTORIES.get(type(device))
+                if factory is not None:
+                    entities.append(factory(device, hub))
+                if getattr(device, "is_online", _SENTINEL) is not _SENTINEL:
                     entities.append(
                         VivintBinarySensorEntity(
                             device=device,
@@ -76,7 +83,7 @@ async def async_setup_entry(
     if not entities:
         return
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
     @callback
     def async_add_sensor(device: VivintDevice) -> None:
@@ -133,8 +140,18 @@ ONLINE_SENSOR_ENTITY_DESCRIPTION = VivintBinarySensorEntityDescription(
     device_class=BinarySensorDeviceClass.CONNECTIVITY,
     entity_category=EntityCategory.DIAGNOSTIC,
     name="Online",
-    is_on=lambda device: getattr(device, "is_online"),
+    is_on=attrgetter("is_online"),
 )
+DEVICE_ENTITY_FACTORIES: dict[
+    type, Callable[[VivintDevice, VivintHub], BinarySensorEntity]
+] = {
+    WirelessSensor: lambda device, hub: VivintBinarySensorEntityOld(
+        device=device, hub=hub
+    ),
+    Camera: lambda device, hub: VivintCameraBinarySensorEntity(
+        device=device, hub=hub, entity_description=ENTITY_DESCRIPTION_MOTION
+    ),
+}
 
 
 class VivintBinarySensorEntity(VivintBaseEntity, BinarySensorEntity):
@@ -151,58 +168,44 @@ class VivintBinarySensorEntity(VivintBaseEntity, BinarySensorEntity):
 class VivintBinarySensorEntityOld(VivintEntity, BinarySensorEntity):
     """Vivint Binary Sensor."""
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.device.alarm_panel.id}-{self.device.id}"
+    def __init__(self, device: WirelessSensor, hub: VivintHub) -> None:
+        """Pass coordinator to CoordinatorEntity."""
+        super().__init__(device=device, hub=hub)
+        self._attr_unique_id = f"{device.alarm_panel.id}-{device.id}"
+        self._attr_device_class = self._get_device_class()
 
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
         return self.device.is_on
 
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return the class of this device."""
+    def _get_device_class(self) -> BinarySensorDeviceClass | None:
+        """Determine the class of this device."""
         equipment_type = self.device.equipment_type
 
-        if equipment_type == EquipmentType.MOTION:
-            return BinarySensorDeviceClass.MOTION
-
-        elif equipment_type == EquipmentType.FREEZE:
-            return BinarySensorDeviceClass.COLD
-
-        elif equipment_type == EquipmentType.WATER:
-            return BinarySensorDeviceClass.MOISTURE
+        if equipment_type in EQUIPMENT_CLASS_MAP:
+            return EQUIPMENT_CLASS_MAP[equipment_type]
 
-        elif equipment_type == EquipmentType.TEMPERATURE:
-            return BinarySensorDeviceClass.HEAT
-
-        elif equipment_type == EquipmentType.CONTACT:
-            sensor_type = self.device.sensor_type
-
-            if sensor_type == SensorType.EXIT_ENTRY_1:
-                return (
-                    BinarySensorDeviceClass.GARAGE_DOOR
-                    if "TILT" in self.device.equipment_code.name
-                    else BinarySensorDeviceClass.DOOR
-                )
+        if equipment_type != EquipmentType.CONTACT:
+            return BinarySensorDeviceClass.SAFETY
 
-            elif sensor_type == SensorType.PERIMETER:
-                return (
-                    BinarySensorDeviceClass.SAFETY
-                    if "GLASS_BREAK" in self.device.equipment_code.name
-                    else BinarySensorDeviceClass.WINDOW
-                )
+        sensor_type = self.device.sensor_type
 
-            elif sensor_type in [SensorType.FIRE, SensorType.FIRE_WITH_VERIFICATION]:
-                return BinarySensorDeviceClass.SMOKE
+        if sensor_type == SensorType.EXIT_ENTRY_1:
+            return (
+                BinarySensorDeviceClass.GARAGE_DOOR
+                if "TILT" in self.device.equipment_code.name
+                else BinarySensorDeviceClass.DOOR
+            )
 
-            elif sensor_type == SensorType.CARBON_MONOXIDE:
-                return BinarySensorDeviceClass.GAS
+        if sensor_type == SensorType.PERIMETER:
+            return (
+                BinarySensorDeviceClass.SAFETY
+                if "GLASS_BREAK" in self.device.equipment_code.name
+                else BinarySensorDeviceClass.WINDOW
+            )
 
-        else:
-            return BinarySensorDeviceClass.SAFETY
+        return SENSOR_CLASS_MAP.get(sensor_type)
 
 
 class VivintCameraBinarySensorEntity(VivintEntity, BinarySensorEntity):
@@ -217,26 +220,15 @@ class VivintCameraBinarySensorEntity(VivintEntity, BinarySensorEntity):
         """Pass coordinator to CoordinatorEntity."""
         super().__init__(device=device, hub=hub)
         self.entity_description = entity_description
-        self._last_motion_event: datetime | None = None
+        self._attr_name = f"{device.name} Motion"
+        self._attr_unique_id = f"{device.alarm_panel.id}-{device.id}"
+        self._motion_expiry: float | None = None
         self._motion_stopped_callback: CALLBACK_TYPE = None
 
-    @property
-    def name(self) -> str:
-        """Return the name of this entity."""
-        return f"{self.device.name} Motion"
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.device.alarm_panel.id}-{self.device.id}"
-
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
-        return (
-            self._last_motion_event is not None
-            and self._last_motion_event >= utcnow() - timedelta(seconds=30)
-        )
+        return self._motion_expiry is not None and monotonic() < self._motion_expiry
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
@@ -251,19 +243,32 @@ class VivintCameraBinarySensorEntity(VivintEntity, BinarySensorEntity):
     @callback
     def _motion_callback(self, _) -> None:
         """Call motion method."""
-        self.async_cancel_motion_stopped_callback()
+        self._motion_expiry = monotonic() + MOTION_STOPPED_SECONDS
 
-        self._last_motion_event = utcnow()
-        self.async_write_ha_state()
+        if self._motion_stopped_callback is not None:
+            # A timer is already armed from an earlier event in this burst;
+            # the stopped callback re-arms itself until the newest event has
+            # aged out, so there is nothing to reschedule or write here.
+            return
 
+        self.async_write_ha_state()
         self._motion_stopped_callback = async_call_later(
-            self.hass, MOTION_STOPPED_SECONDS, self.async_motion_stopped_callback
+            self.hass, MOTION_STOPPED_SECONDS, self._motion_stopped
         )
 
-    async def async_motion_stopped_callback(self, *_) -> None:
-        """Motion stopped callback."""
+    @callback
+    def _motion_stopped(self, _now) -> None:
+        """Handle the motion-stopped timer firing."""
         self._motion_stopped_callback = None
-        self._last_motion_event = None
+        remaining = self._motion_expiry - monotonic()
+        if remaining > 0:
+            # Motion retriggered while the timer was running; re-arm for the
+            # remainder of the window from the newest event.
+            self._motion_stopped_callback = async_call_later(
+                self.hass, remaining, self._motion_stopped
+            )
+            return
+        self._motion_expiry = None
         self.async_write_ha_state()
 
     @callback
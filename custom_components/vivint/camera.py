@@ -1,6 +1,7 @@
 """Support for Vivint cameras."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from vivintpy.devices.camera import Camera as VivintCamera
@@ -10,6 +11,7 @@ from homeassistant.components.ffmpeg import async_get_image
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, format_mac
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -62,20 +64,23 @@ async def async_setup_entry(
     if not entities:
         return
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 async def log_rtsp_urls(device: VivintCamera) -> None:
     """Logs the rtsp urls of a Vivint camera."""
+    urls = await asyncio.gather(
+        device.get_direct_rtsp_url(hd=True),
+        device.get_direct_rtsp_url(hd=False),
+        device.get_rtsp_url(internal=True, hd=True),
+        device.get_rtsp_url(internal=True, hd=False),
+        device.get_rtsp_url(internal=False, hd=True),
+        device.get_rtsp_url(internal=False, hd=False),
+    )
     _LOGGER.info(
         "%s rtsp urls:\n  direct hd: %s\n  direct sd: %s\n  internal hd: %s\n  internal sd: %s\n  external hd: %s\n  external sd: %s",
         device.name,
-        await device.get_direct_rtsp_url(hd=True),
-        await device.get_direct_rtsp_url(hd=False),
-        await device.get_rtsp_url(internal=True, hd=True),
-        await device.get_rtsp_url(internal=True, hd=False),
-        await device.get_rtsp_url(internal=False, hd=True),
-        await device.get_rtsp_url(internal=False, hd=False),
+        *urls,
     )
 
 
@@ -97,30 +102,34 @@ class VivintCameraEntity(VivintEntity, Camera):
         super().__init__(device=device, hub=hub)
         Camera.__init__(self)
 
+        # Copy the shared device info before mutating it with the camera's
+        # network connection.
+        self._attr_device_info = DeviceInfo(self._attr_device_info)
         self._attr_device_info.setdefault("connections", set()).add(
             (CONNECTION_NETWORK_MAC, format_mac(device.mac_address))
         )
 
+        self._attr_unique_id = f"{device.alarm_panel.id}-{device.id}"
         self.__hd_stream = hd_stream
         self.__rtsp_stream = rtsp_stream
         self.__stream_source = None
+        self.__stream_lock = asyncio.Lock()
         self.__last_image = None
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.device.alarm_panel.id}-{self.device.id}"
-
     async def stream_source(self) -> str | None:
         """Return the source of the stream."""
         if not self.__stream_source:
-            self.__stream_source = (
-                await self.device.get_direct_rtsp_url(hd=self.__hd_stream)
-                if self.__rtsp_stream == RTSP_STREAM_DIRECT
-                else None
-            ) or await self.device.get_rtsp_url(
-                internal=self.__rtsp_stream != RTSP_STREAM_EXTERNAL, hd=self.__hd_stream
-            )
+            async with self.__stream_lock:
+                # Recheck in case a concurrent caller built it while waiting.
+                if not self.__stream_source:
+                    self.__stream_source = (
+                        await self.device.get_direct_rtsp_url(hd=self.__hd_stream)
+                        if self.__rtsp_stream == RTSP_STREAM_DIRECT
+                        else None
+                    ) or await self.device.get_rtsp_url(
+                        internal=self.__rtsp_stream != RTSP_STREAM_EXTERNAL,
+                        hd=self.__hd_stream,
+                    )
         return self.__stream_source
 
     async def async_camera_image(
@@ -134,7 +143,7 @@ class VivintCameraEntity(VivintEntity, Camera):
                 width=width,
                 height=height,
             )
-        except:  # pylint:disable=bare-except
+        except Exception:  # pylint:disable=broad-except
             _LOGGER.debug("Could not retrieve latest image for %s", self.name)
 
         return self.__last_image
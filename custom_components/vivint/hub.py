@@ -3,8 +3,10 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from datetime import timedelta
+from functools import lru_cache
 import logging
 import os
+from weakref import WeakKeyDictionary
 
 import aiohttp
 from aiohttp import ClientResponseError
@@ -23,6 +25,7 @@ from vivintpy.exceptions import (
 
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -36,17 +39,47 @@ _LOGGER = logging.getLogger(__name__)
 CACHE_VERSION = "_1" if AweVer(aiohttp.__version__) >= AweVer("3.8.4") else ""
 DEFAULT_CACHEDB = f".vivintpy_cache{CACHE_VERSION}.pickle"
 UPDATE_INTERVAL = 300
+STATE_WRITE_COOLDOWN = 0.1
+
+
+@lru_cache(maxsize=1024)
+def get_device_id_from_ids(panel_id: int, device_id: int) -> tuple[str, str]:
+    """Get device registry identifier for a panel and device id pair."""
+    return (DOMAIN, f"{panel_id}-{device_id}")
 
 
 @callback
 def get_device_id(device: VivintDevice) -> tuple[str, str]:
     """Get device registry identifier for device."""
-    return (
-        DOMAIN,
-        f"{device.panel_id}-{device.parent.id if device.is_subdevice else device.id}",
+    return get_device_id_from_ids(
+        device.panel_id, device.parent.id if device.is_subdevice else device.id
     )
 
 
+# Weakly keyed so reloading a config entry does not pin the previous
+# session's device tree in memory.
+_DEVICE_INFO_CACHE: WeakKeyDictionary[VivintDevice, DeviceInfo] = WeakKeyDictionary()
+
+
+def _build_device_info(device: VivintDevice) -> DeviceInfo:
+    """Build the device info for a device, shared across its entities."""
+    device_info = _DEVICE_INFO_CACHE.get(device)
+    if device_info is None:
+        device_info = DeviceInfo(
+            default_manufacturer="Vivint",
+            identifiers={get_device_id(device)},
+            name=device.name if device.name else type(device).__name__,
+            manufacturer=device.manufacturer,
+            model=device.model,
+            sw_version=device.software_version,
+            via_device=None
+            if isinstance(device, AlarmPanel)
+            else get_device_id(device.alarm_panel),
+        )
+        _DEVICE_INFO_CACHE[device] = device_info
+    return device_info
+
+
 class VivintHub:
     """A Vivint hub wrapper class."""
 
@@ -54,16 +87,26 @@ class VivintHub:
         self, hass: HomeAssistant, data: dict, undo_listener: Callable | None = None
     ) -> None:
         """Initialize the Vivint hub."""
+        self._hass = hass
         self._data = data
         self.__undo_listener = undo_listener
         self.account: Account = None
         self.logged_in = False
         self.session: ClientSession = None
+        self._cookie_jar: aiohttp.CookieJar = None
         self.cache_file = hass.config.path(DEFAULT_CACHEDB)
 
-        async def _async_update_data() -> None:
+        async def _async_update_data() -> dict[tuple[int, int], dict]:
             """Update all device states from the Vivint API."""
-            return await self.account.refresh()
+            await self.account.refresh()
+            # Snapshot the device data so the coordinator can compare refresh
+            # results and skip listener callbacks when nothing has changed.
+            return {
+                (alarm_panel.id, device.id): dict(device.data)
+                for system in self.account.systems
+                for alarm_panel in system.alarm_panels
+                for device in alarm_panel.devices
+            }
 
         self.coordinator = DataUpdateCoordinator(
             hass,
@@ -71,6 +114,7 @@ class VivintHub:
             name=DOMAIN,
             update_method=_async_update_data,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            always_update=False,
         )
 
     async def login(
@@ -82,11 +126,14 @@ class VivintHub:
         # Get previous session if available
         abs_cookie_jar = aiohttp.CookieJar()
         try:
-            abs_cookie_jar.load(self.cache_file)
-        except:  # pylint: disable=bare-except
+            await self._hass.async_add_executor_job(
+                abs_cookie_jar.load, self.cache_file
+            )
+        except Exception:  # pylint: disable=broad-except
             _LOGGER.debug("No previous session found")
 
         self.session = ClientSession(cookie_jar=abs_cookie_jar)
+        self._cookie_jar = abs_cookie_jar
 
         self.account = Account(
             username=self._data[CONF_USERNAME],
@@ -99,7 +146,7 @@ class VivintHub:
                 load_devices=load_devices,
                 subscribe_for_realtime_updates=subscribe_for_realtime_updates,
             )
-            return self.save_session()
+            return await self.save_session()
         except VivintSkyApiMfaRequiredError as ex:
             raise ex
         except VivintSkyApiAuthenticationError as ex:
@@ -125,7 +172,7 @@ class VivintHub:
         """Verify MFA."""
         try:
             await self.account.verify_mfa(code)
-            return self.save_session()
+            return await self.save_session()
         except Exception as ex:
             raise ex
 
@@ -133,11 +180,10 @@ class VivintHub:
         """Remove the cached session file."""
         os.remove(self.cache_file)
 
-    def save_session(self) -> bool:
+    async def save_session(self) -> bool:
         """Save session for reuse."""
-        # pylint: disable=protected-access
-        self.account.vivintskyapi._VivintSkyApi__client_session.cookie_jar.save(
-            self.cache_file
+        await self._hass.async_add_executor_job(
+            self._cookie_jar.save, self.cache_file
         )
         self.logged_in = True
         return self.logged_in
@@ -161,29 +207,28 @@ class VivintBaseEntity(CoordinatorEntity):
         self.device = device
         self.hub = hub
         self.entity_description = entity_description
+        self._last_device_data: dict | None = None
 
         self._attr_unique_id = (
             f"{device.alarm_panel.id}-{device.id}-{entity_description.key}"
         )
-        device = self.device.parent if self.device.is_subdevice else self.device
-        self._attr_device_info = DeviceInfo(
-            default_manufacturer="Vivint",
-            identifiers={get_device_id(device)},
-            name=device.name if device.name else type(device).__name__,
-            manufacturer=device.manufacturer,
-            model=device.model,
-            sw_version=device.software_version,
-            via_device=None
-            if isinstance(device, AlarmPanel)
-            else get_device_id(device.alarm_panel),
+        self._attr_device_info = _build_device_info(
+            device.parent if device.is_subdevice else device
         )
 
     async def async_added_to_hass(self) -> None:
         """Set up a listener for the entity."""
         await super().async_added_to_hass()
-        self.async_on_remove(
-            self.device.on(UPDATE, lambda _: self.async_write_ha_state())
-        )
+        self.async_on_remove(self.device.on(UPDATE, self._handle_device_update))
+
+    @callback
+    def _handle_device_update(self, _) -> None:
+        """Write the state only if the device data has changed."""
+        data = self.device.data
+        if data == self._last_device_data:
+            return
+        self._last_device_data = dict(data)
+        self.async_write_ha_state()
 
 
 class VivintEntity(CoordinatorEntity):
@@ -196,28 +241,32 @@ class VivintEntity(CoordinatorEntity):
         super().__init__(hub.coordinator)
         self.device = device
         self.hub = hub
+        self._attr_name = device.name
+        self._last_device_data: dict | None = None
+        self._write_debouncer: Debouncer | None = None
 
-        device = self.device.parent if self.device.is_subdevice else self.device
-        self._attr_device_info = DeviceInfo(
-            default_manufacturer="Vivint",
-            identifiers={get_device_id(device)},
-            name=device.name if device.name else type(device).__name__,
-            manufacturer=device.manufacturer,
-            model=device.model,
-            sw_version=device.software_version,
-            via_device=None
-            if isinstance(device, AlarmPanel)
-            else get_device_id(device.alarm_panel),
+        self._attr_device_info = _build_device_info(
+            device.parent if device.is_subdevice else device
         )
 
     async def async_added_to_hass(self) -> None:
         """Set up a listener for the entity."""
         await super().async_added_to_hass()
-        self.async_on_remove(
-            self.device.on(UPDATE, lambda _: self.async_write_ha_state())
+        self._write_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=STATE_WRITE_COOLDOWN,
+            immediate=True,
+            function=self.async_write_ha_state,
         )
-
-    @property
-    def name(self) -> str:
-        """Return the name of this entity."""
-        return self.device.name
+        self.async_on_remove(self._write_debouncer.async_cancel)
+        self.async_on_remove(self.device.on(UPDATE, self._handle_device_update))
+
+    @callback
+    def _handle_device_update(self, _) -> None:
+        """Write the state only if the device data has changed."""
+        data = self.device.data
+        if data == self._last_device_data:
+            return
+        self._last_device_data = dict(data)
+        self._write_debouncer.async_schedule_call()